@@ -756,7 +756,8 @@ class AppleRemindersService(Service):
         super().__init__(*args, **kwargs)
         self.client = None
 
-    def get_keyring_service(self, config):
+    @staticmethod
+    def get_keyring_service(config):
         """Apple Reminders doesn't use API keys."""
         return "bugwarrior://applereminders"
 
@@ -1,10 +1,14 @@
+import dataclasses
 import datetime
 import sys
+import typing
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 
-import pytz
+import pytest
 
 from bugwarrior.collect import TaskConstructor
+from bugwarrior.config import schema
 from .base import ServiceTest, AbstractServiceTest
 
 # Mock EventKit and Foundation before importing our service
@@ -45,17 +49,28 @@ class MockNSDateComponents:
 class MockEKReminder:
     """Mock EventKit EKReminder object."""
 
+    __slots__ = (
+        '_id', '_title', '_notes', '_due_date', '_completed', '_completion_date',
+        '_creation_date', '_modification_date', '_priority', '_flagged',
+        '_due_components',
+    )
+
+    DEFAULTS = {
+        'id': 'test-reminder-id',
+        'title': 'Test Reminder',
+        'notes': 'Test notes',
+        'due_date': None,
+        'completed': False,
+        'completion_date': None,
+        'creation_date': None,
+        'modification_date': None,
+        'priority': 0,  # EventKit priority mapping
+        'flagged': False,
+    }
+
     def __init__(self, **kwargs):
-        self._id = kwargs.get('id', 'test-reminder-id')
-        self._title = kwargs.get('title', 'Test Reminder')
-        self._notes = kwargs.get('notes', 'Test notes')
-        self._due_date = kwargs.get('due_date')
-        self._completed = kwargs.get('completed', False)
-        self._completion_date = kwargs.get('completion_date')
-        self._creation_date = kwargs.get('creation_date')
-        self._modification_date = kwargs.get('modification_date')
-        self._priority = kwargs.get('priority', 0)  # EventKit priority mapping
-        self._flagged = kwargs.get('flagged', False)
+        for key, default in self.DEFAULTS.items():
+            setattr(self, '_' + key, kwargs.get(key, default))
         self._due_components = None
         if self._due_date:
             # Create mock NSDateComponents
@@ -89,199 +104,226 @@ class MockEKReminder:
         return self._due_components
 
 
-class MockEKCalendar:
-    """Mock EventKit EKCalendar object."""
-
-    def __init__(self, name, reminders_data=None):
-        self._name = name
-        self._reminders_data = reminders_data or []
-
-    def title(self):
-        return self._name
-
-
-class MockEKEventStore:
-    """Mock EventKit EKEventStore object."""
-
-    def __init__(self, lists_data=None):
-        self._lists_data = lists_data or {}
-        self._calendars = []
-        for list_name, reminders_data in self._lists_data.items():
-            self._calendars.append(MockEKCalendar(list_name, reminders_data))
-
-    @classmethod
-    def alloc(cls):
-        return cls()
-
-    def init(self):
-        return self
-
-    def calendarsForEntityType_(self, entity_type):
-        return self._calendars
-
-    def predicateForRemindersInCalendars_(self, calendars):
-        # Return a mock predicate
-        return Mock()
-
-    def fetchRemindersMatchingPredicate_completion_(self, predicate, completion_handler):
-        # Return reminders for all calendars
-        reminders = []
-        for calendar in self._calendars:
-            for reminder_data in calendar._reminders_data:
-                reminders.append(MockEKReminder(**reminder_data))
-        completion_handler(reminders)
-        
-    def accessGrantedForEntityType_(self, entity_type):
-        return True  # Mock that we have access
-
-
 # Test data constants
-ARBITRARY_CREATED = datetime.datetime(2023, 1, 15, 10, 0, 0, tzinfo=pytz.UTC)
-ARBITRARY_MODIFIED = datetime.datetime(2023, 1, 16, 11, 30, 0, tzinfo=pytz.UTC)
-ARBITRARY_DUE = datetime.datetime(2023, 1, 20, 15, 0, 0, tzinfo=pytz.UTC)
-ARBITRARY_COMPLETED = datetime.datetime(2023, 1, 18, 14, 0, 0, tzinfo=pytz.UTC)
-
-ARBITRARY_REMINDER = {
-    'id': 'test-reminder-123',
-    'title': 'Buy groceries',
-    'notes': 'Milk, bread, eggs',
-    'due_date': ARBITRARY_DUE,
-    'completed': False,
-    'completion_date': None,
-    'creation_date': ARBITRARY_CREATED,
-    'modification_date': ARBITRARY_MODIFIED,
-    'priority': 5,  # Medium priority
-    'list_name': 'Shopping',
-    'url': 'x-apple-reminderkit://REMCDReminder/test-reminder-123',
-    'flagged': True,
-    'subtasks': [],
-}
-
-COMPLETED_REMINDER = {
-    'id': 'test-reminder-456',
-    'title': 'Completed task',
-    'notes': 'This was finished',
-    'due_date': ARBITRARY_DUE,
-    'completed': True,
-    'completion_date': ARBITRARY_COMPLETED,
-    'creation_date': ARBITRARY_CREATED,
-    'modification_date': ARBITRARY_MODIFIED,
-    'priority': 9,  # Internal high priority
-    'list_name': 'Work',
-    'url': 'x-apple-reminderkit://REMCDReminder/test-reminder-456',
-    'flagged': False,
-    'subtasks': [],
-}
-
-HIGH_PRIORITY_REMINDER = {
-    'id': 'test-reminder-789',
-    'title': 'Urgent task',
-    'notes': '',
-    'due_date': None,
-    'completed': False,
-    'completion_date': None,
-    'creation_date': ARBITRARY_CREATED,
-    'modification_date': ARBITRARY_MODIFIED,
-    'priority': 9,  # Internal high priority
-    'list_name': 'Work',
-    'url': 'x-apple-reminderkit://REMCDReminder/test-reminder-789',
-    'flagged': False,
-    'subtasks': [],
-}
+ARBITRARY_CREATED = datetime.datetime(2023, 1, 15, 10, 0, 0, tzinfo=datetime.timezone.utc)
+ARBITRARY_MODIFIED = datetime.datetime(2023, 1, 16, 11, 30, 0, tzinfo=datetime.timezone.utc)
+ARBITRARY_DUE = datetime.datetime(2023, 1, 20, 15, 0, 0, tzinfo=datetime.timezone.utc)
+ARBITRARY_COMPLETED = datetime.datetime(2023, 1, 18, 14, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+@dataclasses.dataclass(frozen=True)
+class ReminderFixture:
+    """ A reminder as AppleRemindersClient._reminder_to_dict returns it. """
+    id: str
+    title: str
+    notes: str = ''
+    due_date: typing.Optional[datetime.datetime] = None
+    completed: bool = False
+    completion_date: typing.Optional[datetime.datetime] = None
+    creation_date: datetime.datetime = ARBITRARY_CREATED
+    modification_date: datetime.datetime = ARBITRARY_MODIFIED
+    priority: int = 0  # No priority
+    list_name: str = 'Personal'
+    flagged: bool = False
+    subtasks: list = dataclasses.field(default_factory=list)
+
+    def asdict(self):
+        # Reminders are read-only so that every test can share them.
+        return MappingProxyType({
+            **dataclasses.asdict(self),
+            'url': f'x-apple-reminderkit://REMCDReminder/{self.id}',
+        })
 
-LOW_PRIORITY_REMINDER = {
-    'id': 'test-reminder-low',
-    'title': 'Low priority task',
-    'notes': 'Can wait',
-    'due_date': None,
-    'completed': False,
-    'completion_date': None,
-    'creation_date': ARBITRARY_CREATED,
-    'modification_date': ARBITRARY_MODIFIED,
-    'priority': 1,  # Internal low priority
-    'list_name': 'Personal',
-    'url': 'x-apple-reminderkit://REMCDReminder/test-reminder-low',
-    'flagged': False,
-    'subtasks': [],
-}
 
-NO_PRIORITY_REMINDER = {
-    'id': 'test-reminder-none',
-    'title': 'No priority task',
-    'notes': '',
-    'due_date': None,
-    'completed': False,
-    'completion_date': None,
-    'creation_date': ARBITRARY_CREATED,
-    'modification_date': ARBITRARY_MODIFIED,
-    'priority': 0,  # No priority
-    'list_name': 'Personal',
-    'url': 'x-apple-reminderkit://REMCDReminder/test-reminder-none',
-    'flagged': False,
-    'subtasks': [],
-}
+ARBITRARY_REMINDER = ReminderFixture(
+    id='test-reminder-123',
+    title='Buy groceries',
+    notes='Milk, bread, eggs',
+    due_date=ARBITRARY_DUE,
+    priority=5,  # Medium priority
+    list_name='Shopping',
+    flagged=True,
+).asdict()
+
+COMPLETED_REMINDER = ReminderFixture(
+    id='test-reminder-456',
+    title='Completed task',
+    notes='This was finished',
+    due_date=ARBITRARY_DUE,
+    completed=True,
+    completion_date=ARBITRARY_COMPLETED,
+    priority=9,  # Internal high priority
+    list_name='Work',
+).asdict()
+
+HIGH_PRIORITY_REMINDER = ReminderFixture(
+    id='test-reminder-789',
+    title='Urgent task',
+    priority=9,  # Internal high priority
+    list_name='Work',
+).asdict()
+
+LOW_PRIORITY_REMINDER = ReminderFixture(
+    id='test-reminder-low',
+    title='Low priority task',
+    notes='Can wait',
+    priority=1,  # Internal low priority
+).asdict()
+
+NO_PRIORITY_REMINDER = ReminderFixture(
+    id='test-reminder-none',
+    title='No priority task',
+).asdict()
+
+# What the shared issues() run gets from its client
+ISSUES_REMINDERS = (ARBITRARY_REMINDER, HIGH_PRIORITY_REMINDER)
+
+# One reminder per priority band
+PRIORITY_REMINDERS = (
+    HIGH_PRIORITY_REMINDER,    # priority 9 -> H
+    ARBITRARY_REMINDER,        # priority 5 -> M
+    LOW_PRIORITY_REMINDER,     # priority 1 -> L
+    NO_PRIORITY_REMINDER,      # priority 0 -> default
+)
 
 ARBITRARY_EXTRA = {
     'project': 'Shopping',
     'annotations': [],
 }
 
+# What ARBITRARY_REMINDER should become, before and after TaskConstructor
+EXPECTED_ARBITRARY_RECORD = MappingProxyType({
+    'annotations': [],
+    'due': ARBITRARY_DUE.strftime('%Y%m%dT%H%M%SZ'),
+    'entry': ARBITRARY_CREATED.strftime('%Y%m%dT%H%M%SZ'),
+    'priority': 'M',
+    'project': 'Shopping',
+    'status': 'pending',
+    'tags': [],
+
+    # Apple Reminders specific UDAs
+    'appleremindersid': 'test-reminder-123',
+    'applereminderstitle': 'Buy groceries',
+    'applereminderssubnotes': 'Milk, bread, eggs',
+    'appleremindersduedate': ARBITRARY_DUE.strftime('%Y%m%dT%H%M%SZ'),
+    'applereminderscreationdate': ARBITRARY_CREATED.strftime('%Y%m%dT%H%M%SZ'),
+    'appleremindersmodificationdate': ARBITRARY_MODIFIED.strftime('%Y%m%dT%H%M%SZ'),
+    'applereminderslist': 'Shopping',
+    'appleremindersurl': 'x-apple-reminderkit://REMCDReminder/test-reminder-123',
+    'appleremindersflagged': 'true',
+})
+EXPECTED_ARBITRARY_TASK = MappingProxyType({
+    **EXPECTED_ARBITRARY_RECORD,
+    'description': '(bw)Is# - Buy groceries',
+})
+
+
+def _mock_calendar(name):
+    calendar = Mock()
+    calendar.title.return_value = name
+    return calendar
+
+
+# The client only reads calendars, so every test can share the same ones.
+MOCK_CALENDARS = {name: _mock_calendar(name) for name in ('Work', 'Personal', 'Archive')}
+
+
+def _mock_client_with(reminders):
+    """Return a mock AppleRemindersClient returning the given reminders."""
+    mock_client = Mock(spec=AppleRemindersClient)
+    mock_client.get_reminders.return_value = reminders
+    return mock_client
+
+
+@pytest.fixture(scope='session')
+def base_config():
+    """
+    A validated default configuration.
+
+    Tests which only need a variation of it should derive one with
+    ``base_config.copy(update=...)`` rather than validating a new one.
+    """
+    return AppleRemindersConfig(service='applereminders')
+
+
+@pytest.fixture(scope='module')
+def make_service(tmp_path_factory):
+    """
+    Return a builder for AppleRemindersService, like ServiceTest.get_mock_service.
+
+    The services get their own taskrc since these tests don't run inside
+    ConfigTest's per-test environment.
+    """
+    data_path = tmp_path_factory.mktemp('applereminders')
+    taskrc = data_path / '.taskrc'
+    taskrc.write_text(f'data.location={data_path}\n')
+
+    def _make_service(config_overrides=None):
+        section = 'unspecified'
+        service_config = AppleRemindersConfig(
+            service='applereminders', target=section, **(config_overrides or {}))
+        main_config = schema.MainSectionConfig(
+            **ServiceTest.GENERAL_CONFIG, targets=[section], taskrc=str(taskrc))
+        return AppleRemindersService(service_config, main_config)
+
+    return _make_service
+
+
+@pytest.fixture(scope='module')
+def service(make_service):
+    """
+    A service with the default configuration.
+
+    Tests which call service.issues() cache a client on the service and must
+    build their own with make_service.
+    """
+    return make_service()
+
+
+@pytest.fixture(scope='module')
+def issue(service):
+    return service.get_issue_for_record(ARBITRARY_REMINDER, ARBITRARY_EXTRA)
+
+
+@pytest.fixture(scope='module')
+def issues(make_service):
+    """Output of a single service.issues() run, shared by the service tests."""
+    service = make_service(config_overrides={
+        'add_notes_as_annotation': True,
+        'import_labels_as_tags': True,
+    })
+    with patch(
+        'bugwarrior.services.applereminders.AppleRemindersClient',
+        return_value=_mock_client_with(ISSUES_REMINDERS)
+    ):
+        return list(service.issues())
 
-class TestAppleRemindersIssue(AbstractServiceTest, ServiceTest):
-    """Test cases for AppleRemindersIssue class."""
-
-    maxDiff = None
-    SERVICE_CONFIG = {
-        'service': 'applereminders',
-    }
-
-    def test_to_taskwarrior(self):
-        """Test conversion of reminder to taskwarrior format."""
-        service = self.get_mock_service(AppleRemindersService)
-        issue = service.get_issue_for_record(ARBITRARY_REMINDER, ARBITRARY_EXTRA)
 
-        # Mock the date formatting to simulate proper NSDate handling
-        with patch.object(issue, '_get_formatted_date') as mock_format_date:
-            def format_date_side_effect(date_value):
-                if date_value is None:
-                    return None
-                if hasattr(date_value, 'strftime'):
-                    return date_value.strftime('%Y%m%dT%H%M%SZ')
-                return None
+@pytest.fixture(scope='module')
+def tasks(issues):
+    return [TaskConstructor(issue).get_taskwarrior_record() for issue in issues]
 
-            mock_format_date.side_effect = format_date_side_effect
-            actual_output = issue.to_taskwarrior()
 
-        # Basic taskwarrior fields
-        self.assertEqual(actual_output['project'], ARBITRARY_REMINDER['list_name'])
-        self.assertEqual(actual_output['priority'], 'M')  # Medium priority (5 -> M)
-        self.assertEqual(actual_output['annotations'], [])
-        self.assertEqual(actual_output['tags'], [])
-        self.assertEqual(actual_output['status'], 'pending')
+@pytest.fixture(scope='module')
+def priority_tasks(make_service):
+    """Task records from a single service.issues() run over PRIORITY_REMINDERS."""
+    service = make_service(config_overrides={
+        'lists': ['Work'],
+        'import_labels_as_tags': True,
+    })
+    with patch(
+        'bugwarrior.services.applereminders.AppleRemindersClient',
+        return_value=_mock_client_with(PRIORITY_REMINDERS)
+    ):
+        return [TaskConstructor(issue).get_taskwarrior_record()
+                for issue in service.issues()]
 
-        # Should have dates formatted for taskwarrior
-        self.assertIn('due', actual_output)
-        self.assertIn('entry', actual_output)
 
-        # Apple Reminders specific fields
-        self.assertEqual(actual_output[issue.ID], ARBITRARY_REMINDER['id'])
-        self.assertEqual(actual_output[issue.TITLE], ARBITRARY_REMINDER['title'])
-        self.assertEqual(actual_output[issue.NOTES], ARBITRARY_REMINDER['notes'])
-        self.assertEqual(actual_output[issue.LIST], ARBITRARY_REMINDER['list_name'])
-        self.assertEqual(actual_output[issue.URL], ARBITRARY_REMINDER['url'])
-        self.assertEqual(actual_output[issue.FLAGGED], 'true')
-
-        # Check date fields are present
-        self.assertIn(issue.DUE_DATE, actual_output)
-        self.assertIn(issue.CREATION_DATE, actual_output)
-        self.assertIn(issue.MODIFICATION_DATE, actual_output)
-        # Completion date is only added if the reminder has one (not None)
-        # Not completed, so no completion date field
-        self.assertNotIn(issue.COMPLETION_DATE, actual_output)
+class TestAppleRemindersIssue:
+    """Test cases for AppleRemindersIssue class."""
 
-    def test_to_taskwarrior_completed(self):
+    def test_to_taskwarrior_completed(self, service):
         """Test conversion of completed reminder to taskwarrior format."""
-        service = self.get_mock_service(AppleRemindersService)
         issue = service.get_issue_for_record(
             COMPLETED_REMINDER, {'project': 'Work', 'annotations': []}
         )
@@ -299,28 +341,28 @@ class TestAppleRemindersIssue(AbstractServiceTest, ServiceTest):
             actual_output = issue.to_taskwarrior()
 
         # Basic taskwarrior fields
-        self.assertEqual(actual_output['project'], COMPLETED_REMINDER['list_name'])
-        self.assertEqual(actual_output['priority'], 'H')  # High priority (9 -> H)
-        self.assertEqual(actual_output['annotations'], [])
-        self.assertEqual(actual_output['tags'], [])
-        self.assertEqual(actual_output['status'], 'completed')
+        assert actual_output['project'] == COMPLETED_REMINDER['list_name']
+        assert actual_output['priority'] == 'H'  # High priority (9 -> H)
+        assert actual_output['annotations'] == []
+        assert actual_output['tags'] == []
+        assert actual_output['status'] == 'completed'
 
         # Apple Reminders specific fields
-        self.assertEqual(actual_output[issue.ID], COMPLETED_REMINDER['id'])
-        self.assertEqual(actual_output[issue.TITLE], COMPLETED_REMINDER['title'])
-        self.assertEqual(actual_output[issue.NOTES], COMPLETED_REMINDER['notes'])
-        self.assertEqual(actual_output[issue.LIST], COMPLETED_REMINDER['list_name'])
-        self.assertEqual(actual_output[issue.URL], COMPLETED_REMINDER['url'])
+        assert actual_output[issue.ID] == COMPLETED_REMINDER['id']
+        assert actual_output[issue.TITLE] == COMPLETED_REMINDER['title']
+        assert actual_output[issue.NOTES] == COMPLETED_REMINDER['notes']
+        assert actual_output[issue.LIST] == COMPLETED_REMINDER['list_name']
+        assert actual_output[issue.URL] == COMPLETED_REMINDER['url']
         # Flagged field is only added if the reminder is flagged
-        self.assertNotIn(issue.FLAGGED, actual_output)  # Not flagged, so no flagged field
+        assert issue.FLAGGED not in actual_output  # Not flagged, so no flagged field
 
         # Check completion date is set
-        self.assertIn(issue.COMPLETION_DATE, actual_output)
-        self.assertIsNotNone(actual_output[issue.COMPLETION_DATE])
+        assert issue.COMPLETION_DATE in actual_output
+        assert actual_output[issue.COMPLETION_DATE] is not None
 
-    def test_to_taskwarrior_with_tags(self):
+    def test_to_taskwarrior_with_tags(self, make_service):
         """Test conversion with import_labels_as_tags enabled."""
-        service = self.get_mock_service(AppleRemindersService, config_overrides={
+        service = make_service(config_overrides={
             'import_labels_as_tags': True
         })
         issue = service.get_issue_for_record(ARBITRARY_REMINDER, ARBITRARY_EXTRA)
@@ -328,180 +370,121 @@ class TestAppleRemindersIssue(AbstractServiceTest, ServiceTest):
         actual_output = issue.to_taskwarrior()
 
         # Should include list name as tag
-        self.assertEqual(actual_output['tags'], ['Shopping'])
-
-    def test_to_taskwarrior_priority_mapping(self):
+        assert actual_output['tags'] == ['Shopping']
+
+    @pytest.mark.parametrize('reminder,project,expected', [
+        (HIGH_PRIORITY_REMINDER, 'Work', 'H'),  # 9 -> H
+        (ARBITRARY_REMINDER, 'Shopping', 'M'),  # 5 -> M
+        (LOW_PRIORITY_REMINDER, 'Personal', 'L'),  # 1 -> L
+        (NO_PRIORITY_REMINDER, 'Personal', None),  # 0 -> service default
+    ], ids=['high', 'medium', 'low', 'none'])
+    def test_to_taskwarrior_priority_mapping(self, service, reminder, project, expected):
         """Test priority mapping from Apple Reminders to Taskwarrior."""
-        service = self.get_mock_service(AppleRemindersService)
-
-        # Test high priority (9 -> H)
         issue = service.get_issue_for_record(
-            HIGH_PRIORITY_REMINDER, {'project': 'Work', 'annotations': []}
+            reminder, {'project': project, 'annotations': []}
         )
-        self.assertEqual(issue.to_taskwarrior()['priority'], 'H')
+        assert issue.to_taskwarrior()['priority'] == (
+            expected or service.config.default_priority)
 
-        # Test medium priority (5 -> M)
-        issue = service.get_issue_for_record(ARBITRARY_REMINDER, ARBITRARY_EXTRA)
-        self.assertEqual(issue.to_taskwarrior()['priority'], 'M')
 
-        # Test low priority (1 -> L)
-        issue = service.get_issue_for_record(
-            LOW_PRIORITY_REMINDER, {'project': 'Personal', 'annotations': []}
-        )
-        self.assertEqual(issue.to_taskwarrior()['priority'], 'L')
+class TestAppleRemindersClient:
+    """Test cases for AppleRemindersClient class."""
 
-        # Test no priority (0 -> None, falls back to service default)
-        issue = service.get_issue_for_record(
-            NO_PRIORITY_REMINDER, {'project': 'Personal', 'annotations': []}
+    @pytest.fixture(autouse=True)
+    def mock_store(self, monkeypatch):
+        """
+        Give each test a fresh EventKit module and return its event store.
+
+        Nothing a test configures on the store can leak into the next one, and
+        monkeypatch puts the module-level mock back afterwards.
+        """
+        eventkit = Mock(
+            EKAuthorizationStatusAuthorized=3,
+            EKAuthorizationStatusNotDetermined=0,
+            EKAuthorizationStatusDenied=2,
+            EKEntityTypeReminder=1,
         )
-        self.assertEqual(issue.to_taskwarrior()['priority'], service.config.default_priority)
-
-    def test_issues(self):
-        """Test basic issues() method functionality."""
-        # This will be implemented in the service test
-        pass
-
-
-class TestAppleRemindersClient(ServiceTest):
-    """Test cases for AppleRemindersClient class."""
+        monkeypatch.setitem(sys.modules, 'EventKit', eventkit)
 
-    SERVICE_CONFIG = {
-        'service': 'applereminders',
-    }
+        store = eventkit.EKEventStore.alloc.return_value.init.return_value
+        store.accessGrantedForEntityType_.return_value = True
+        return store
 
-    def setUp(self):
-        super().setUp()
-        # Set up EventKit mocks
-        mock_eventkit.EKAuthorizationStatusAuthorized = 3
-        mock_eventkit.EKAuthorizationStatusNotDetermined = 0
-        mock_eventkit.EKAuthorizationStatusDenied = 2
-        mock_eventkit.EKEntityTypeReminder = 1
-
-        # Mock the store creation
-        self.mock_store = Mock()
-        self.mock_store.accessGrantedForEntityType_.return_value = True
-        mock_eventkit.EKEventStore.alloc.return_value.init.return_value = self.mock_store
-
-    def create_client_with_mocks(self, config):
-        """Helper to create client with mocked EventKit imports."""
-        with patch('builtins.__import__') as mock_import:
-            def import_side_effect(name, *args, **kwargs):
-                if name == 'EventKit':
-                    return mock_eventkit
-                elif name == 'Foundation':
-                    return mock_foundation
-                return __import__(name, *args, **kwargs)
-
-            mock_import.side_effect = import_side_effect
-            return AppleRemindersClient(config)
-
-    def test_init_success(self):
+    def test_init_success(self, base_config):
         """Test successful client initialization."""
-        config = AppleRemindersConfig(service='applereminders')
-
-        client = self.create_client_with_mocks(config)
+        client = AppleRemindersClient(base_config)
 
-        self.assertEqual(client.lists, [])
-        self.assertEqual(client.include_completed, False)
-        self.assertEqual(client.exclude_lists, [])
-        self.assertEqual(client.due_only, False)
+        assert client.lists == []
+        assert client.include_completed is False
+        assert client.exclude_lists == []
+        assert client.due_only is False
 
-    def test_init_with_config(self):
+    def test_init_with_config(self, base_config):
         """Test client initialization with configuration."""
-        config = AppleRemindersConfig(
-            service='applereminders',
-            lists=['Work', 'Personal'],
-            include_completed=True,
-            exclude_lists=['Archive'],
-            due_only=True
-        )
+        config = base_config.copy(update={
+            'lists': ['Work', 'Personal'],
+            'include_completed': True,
+            'exclude_lists': ['Archive'],
+            'due_only': True,
+        })
 
-        client = self.create_client_with_mocks(config)
+        client = AppleRemindersClient(config)
 
-        self.assertEqual(client.lists, ['Work', 'Personal'])
-        self.assertEqual(client.include_completed, True)
-        self.assertEqual(client.exclude_lists, ['Archive'])
-        self.assertEqual(client.due_only, True)
+        assert client.lists == ['Work', 'Personal']
+        assert client.include_completed is True
+        assert client.exclude_lists == ['Archive']
+        assert client.due_only is True
 
-    def test_init_missing_library(self):
+    def test_init_missing_library(self, base_config, monkeypatch):
         """Test client initialization when EventKit library is missing."""
-        config = AppleRemindersConfig(service='applereminders')
+        # A None entry makes the import fail; monkeypatch restores the mock.
+        monkeypatch.setitem(sys.modules, 'EventKit', None)
 
-        with patch(
-            'builtins.__import__',
-            side_effect=ImportError("No module named 'EventKit'")
+        with pytest.raises(
+            ImportError,
+            match=r"EventKit framework not available.*pyobjc-framework-EventKit"
         ):
-            with self.assertRaises(ImportError) as cm:
-                AppleRemindersClient(config)
+            AppleRemindersClient(base_config)
 
-            self.assertIn("EventKit framework not available", str(cm.exception))
-            self.assertIn("pyobjc-framework-EventKit", str(cm.exception))
-
-    def test_init_connection_error(self):
+    def test_init_connection_error(self, base_config, mock_store, monkeypatch):
         """Test client initialization when EventKit access is denied."""
-        config = AppleRemindersConfig(service='applereminders')
-
-        # Mock denied access
-        self.mock_store.accessGrantedForEntityType_.return_value = False
-
-        with patch('builtins.__import__') as mock_import:
-            def import_side_effect(name, *args, **kwargs):
-                if name == 'EventKit':
-                    return mock_eventkit
-                elif name == 'Foundation':
-                    return mock_foundation
-                return __import__(name, *args, **kwargs)
-
-            mock_import.side_effect = import_side_effect
-
-            with self.assertRaises(PermissionError) as cm:
-                AppleRemindersClient(config)
-
-            self.assertIn("Access to Apple Reminders is required", str(cm.exception))
-
-        # Reset for other tests
-        self.mock_store.accessGrantedForEntityType_.return_value = True
-
-    def test_get_reminder_lists_success(self):
+        # Mock denied access, answering each request at once
+        mock_store.accessGrantedForEntityType_.return_value = False
+        mock_store.requestFullAccessToRemindersWithCompletion_.side_effect = (
+            lambda handler: handler(False, None))
+        mock_store.requestAccessToEntityType_completion_.side_effect = (
+            lambda entity_type, handler: handler(False, None))
+        monkeypatch.setattr('time.sleep', lambda seconds: None)
+
+        with pytest.raises(PermissionError, match="Access to Apple Reminders is required"):
+            AppleRemindersClient(base_config)
+
+    def test_get_reminder_lists_success(self, base_config, mock_store):
         """Test successful retrieval of reminder lists."""
-        config = AppleRemindersConfig(service='applereminders')
-        mock_calendars = [Mock(), Mock()]
-        mock_calendars[0].title.return_value = 'Work'
-        mock_calendars[1].title.return_value = 'Personal'
+        mock_calendars = [MOCK_CALENDARS['Work'], MOCK_CALENDARS['Personal']]
 
-        self.mock_store.calendarsForEntityType_.return_value = mock_calendars
+        mock_store.calendarsForEntityType_.return_value = mock_calendars
 
-        client = self.create_client_with_mocks(config)
+        client = AppleRemindersClient(base_config)
         lists = client.get_reminder_lists()
 
-        self.assertEqual(lists, mock_calendars)
+        assert lists == mock_calendars
 
-    def test_get_reminder_lists_error(self):
+    def test_get_reminder_lists_error(self, base_config, mock_store):
         """Test error handling when getting reminder lists fails."""
-        config = AppleRemindersConfig(service='applereminders')
-        self.mock_store.calendarsForEntityType_.side_effect = Exception("Access denied")
+        mock_store.calendarsForEntityType_.side_effect = Exception("Access denied")
 
-        client = self.create_client_with_mocks(config)
+        client = AppleRemindersClient(base_config)
 
-        with self.assertRaises(Exception) as cm:
+        with pytest.raises(Exception, match="Access denied"):
             client.get_reminder_lists()
 
-            self.assertIn("Access denied", str(cm.exception))
-
-        # Reset for other tests
-        self.mock_store.calendarsForEntityType_.side_effect = None
-
-    def test_get_reminders_no_lists_configured(self):
+    def test_get_reminders_no_lists_configured(self, base_config, mock_store):
         """Test getting reminders when no specific lists are configured."""
-        config = AppleRemindersConfig(service='applereminders')
-
         # Set up mock calendars and reminders
-        mock_calendar1 = Mock()
-        mock_calendar1.title.return_value = 'Work'
-        mock_calendar2 = Mock()
-        mock_calendar2.title.return_value = 'Personal'
-
-        self.mock_store.calendarsForEntityType_.return_value = [mock_calendar1, mock_calendar2]
+        mock_store.calendarsForEntityType_.return_value = [
+            MOCK_CALENDARS['Work'], MOCK_CALENDARS['Personal']
+        ]
 
         # Set up mock reminders
         mock_reminder1 = MockEKReminder(**ARBITRARY_REMINDER)
@@ -510,98 +493,81 @@ class TestAppleRemindersClient(ServiceTest):
         def mock_fetch(predicate, completion_handler):
             completion_handler([mock_reminder1, mock_reminder2])
         
-        self.mock_store.fetchRemindersMatchingPredicate_completion_.side_effect = mock_fetch
+        mock_store.fetchRemindersMatchingPredicate_completion_.side_effect = mock_fetch
 
-        client = self.create_client_with_mocks(config)
+        client = AppleRemindersClient(base_config)
         reminders = list(client.get_reminders())
 
-        self.assertEqual(len(reminders), 4)  # 2 calendars * 2 reminders each
+        assert len(reminders) == 4  # 2 calendars * 2 reminders each
         # Check that reminders have expected titles
         titles = [r['title'] for r in reminders]
-        self.assertIn('Buy groceries', titles)
-        self.assertIn('Low priority task', titles)
+        assert 'Buy groceries' in titles
+        assert 'Low priority task' in titles
 
-    def test_get_reminders_specific_lists(self):
+    def test_get_reminders_specific_lists(self, base_config, mock_store):
         """Test getting reminders from specific lists."""
-        config = AppleRemindersConfig(
-            service='applereminders',
-            lists=['Work', 'Personal']
-        )
+        config = base_config.copy(update={
+            'lists': ['Work', 'Personal'],
+        })
 
         # Set up mock calendars
-        mock_work = Mock()
-        mock_work.title.return_value = 'Work'
-        mock_personal = Mock()
-        mock_personal.title.return_value = 'Personal'
-        mock_archive = Mock()
-        mock_archive.title.return_value = 'Archive'
-
-        self.mock_store.calendarsForEntityType_.return_value = [
-            mock_work, mock_personal, mock_archive
+        mock_store.calendarsForEntityType_.return_value = [
+            MOCK_CALENDARS['Work'], MOCK_CALENDARS['Personal'], MOCK_CALENDARS['Archive']
+        ]
+
+        # Set up mock reminders, returned for each calendar queried
+        mock_reminders = [
+            MockEKReminder(**HIGH_PRIORITY_REMINDER),
+            MockEKReminder(**LOW_PRIORITY_REMINDER)
         ]
 
-        # Set up mock reminders for each call
         def mock_fetch_reminders(predicate, completion_handler):
-            # Return different reminders based on which calendar is being queried
-            reminders = [
-                MockEKReminder(**HIGH_PRIORITY_REMINDER),
-                MockEKReminder(**LOW_PRIORITY_REMINDER)
-            ]
-            completion_handler(reminders)
+            completion_handler(mock_reminders)
 
-        self.mock_store.fetchRemindersMatchingPredicate_completion_.side_effect = mock_fetch_reminders
+        mock_store.fetchRemindersMatchingPredicate_completion_.side_effect = mock_fetch_reminders
 
-        client = self.create_client_with_mocks(config)
+        client = AppleRemindersClient(config)
         reminders = list(client.get_reminders())
 
         # Should only get reminders from Work and Personal lists (2 calendars * 2 reminders each)
-        self.assertEqual(len(reminders), 4)
+        assert len(reminders) == 4
         list_names = [r['list_name'] for r in reminders]
-        self.assertIn('Work', list_names)
-        self.assertIn('Personal', list_names)
-        self.assertNotIn('Archive', list_names)
+        assert 'Work' in list_names
+        assert 'Personal' in list_names
+        assert 'Archive' not in list_names
 
-    def test_get_reminders_exclude_lists(self):
+    def test_get_reminders_exclude_lists(self, base_config, mock_store):
         """Test getting reminders while excluding specific lists."""
-        config = AppleRemindersConfig(
-            service='applereminders',
-            exclude_lists=['Archive']
-        )
+        config = base_config.copy(update={
+            'exclude_lists': ['Archive'],
+        })
 
         # Set up mock calendars
-        mock_work = Mock()
-        mock_work.title.return_value = 'Work'
-        mock_personal = Mock()
-        mock_personal.title.return_value = 'Personal'
-        mock_archive = Mock()
-        mock_archive.title.return_value = 'Archive'
-
-        self.mock_store.calendarsForEntityType_.return_value = [
-            mock_work, mock_personal, mock_archive
+        mock_store.calendarsForEntityType_.return_value = [
+            MOCK_CALENDARS['Work'], MOCK_CALENDARS['Personal'], MOCK_CALENDARS['Archive']
         ]
+        mock_reminders = [MockEKReminder(**HIGH_PRIORITY_REMINDER)]
+
         def mock_fetch_reminders(predicate, completion_handler):
-            completion_handler([MockEKReminder(**HIGH_PRIORITY_REMINDER)])
+            completion_handler(mock_reminders)
         
-        self.mock_store.fetchRemindersMatchingPredicate_completion_.side_effect = mock_fetch_reminders
+        mock_store.fetchRemindersMatchingPredicate_completion_.side_effect = mock_fetch_reminders
 
-        client = self.create_client_with_mocks(config)
+        client = AppleRemindersClient(config)
         reminders = list(client.get_reminders())
 
         # Should only get reminders from Work and Personal (not Archive)
-        self.assertEqual(len(reminders), 2)
+        assert len(reminders) == 2
         list_names = [r['list_name'] for r in reminders]
-        self.assertNotIn('Archive', list_names)
+        assert 'Archive' not in list_names
 
-    def test_get_reminders_include_completed(self):
+    def test_get_reminders_include_completed(self, base_config, mock_store):
         """Test getting reminders including completed ones."""
-        config = AppleRemindersConfig(
-            service='applereminders',
-            include_completed=True
-        )
+        config = base_config.copy(update={
+            'include_completed': True,
+        })
 
-        mock_calendar = Mock()
-        mock_calendar.title.return_value = 'Work'
-        self.mock_store.calendarsForEntityType_.return_value = [mock_calendar]
+        mock_store.calendarsForEntityType_.return_value = [MOCK_CALENDARS['Work']]
 
         # Set up completed and non-completed reminders
         mock_reminder1 = MockEKReminder(**HIGH_PRIORITY_REMINDER)
@@ -610,23 +576,19 @@ class TestAppleRemindersClient(ServiceTest):
         def mock_fetch_reminders(predicate, completion_handler):
             completion_handler([mock_reminder1, mock_reminder2])
         
-        self.mock_store.fetchRemindersMatchingPredicate_completion_.side_effect = mock_fetch_reminders
+        mock_store.fetchRemindersMatchingPredicate_completion_.side_effect = mock_fetch_reminders
 
-        client = self.create_client_with_mocks(config)
+        client = AppleRemindersClient(config)
         reminders = list(client.get_reminders())
 
-        self.assertEqual(len(reminders), 2)
+        assert len(reminders) == 2
         completed_statuses = [r['completed'] for r in reminders]
-        self.assertIn(True, completed_statuses)
-        self.assertIn(False, completed_statuses)
+        assert True in completed_statuses
+        assert False in completed_statuses
 
-    def test_get_reminders_exclude_completed(self):
+    def test_get_reminders_exclude_completed(self, base_config, mock_store):
         """Test getting reminders excluding completed ones (default behavior)."""
-        config = AppleRemindersConfig(service='applereminders')
-
-        mock_calendar = Mock()
-        mock_calendar.title.return_value = 'Work'
-        self.mock_store.calendarsForEntityType_.return_value = [mock_calendar]
+        mock_store.calendarsForEntityType_.return_value = [MOCK_CALENDARS['Work']]
 
         # Set up completed and non-completed reminders
         mock_reminder1 = MockEKReminder(**HIGH_PRIORITY_REMINDER)
@@ -635,25 +597,22 @@ class TestAppleRemindersClient(ServiceTest):
         def mock_fetch_reminders(predicate, completion_handler):
             completion_handler([mock_reminder1, mock_reminder2])
         
-        self.mock_store.fetchRemindersMatchingPredicate_completion_.side_effect = mock_fetch_reminders
+        mock_store.fetchRemindersMatchingPredicate_completion_.side_effect = mock_fetch_reminders
 
-        client = self.create_client_with_mocks(config)
+        client = AppleRemindersClient(base_config)
         reminders = list(client.get_reminders())
 
         # Should only get non-completed reminder
-        self.assertEqual(len(reminders), 1)
-        self.assertEqual(reminders[0]['completed'], False)
+        assert len(reminders) == 1
+        assert reminders[0]['completed'] is False
 
-    def test_get_reminders_due_only(self):
+    def test_get_reminders_due_only(self, base_config, mock_store):
         """Test getting reminders with due dates only."""
-        config = AppleRemindersConfig(
-            service='applereminders',
-            due_only=True
-        )
+        config = base_config.copy(update={
+            'due_only': True,
+        })
 
-        mock_calendar = Mock()
-        mock_calendar.title.return_value = 'Work'
-        self.mock_store.calendarsForEntityType_.return_value = [mock_calendar]
+        mock_store.calendarsForEntityType_.return_value = [MOCK_CALENDARS['Work']]
 
         # Set up reminders - one with due date, one without
         mock_reminder1 = MockEKReminder(**ARBITRARY_REMINDER)
@@ -663,42 +622,37 @@ class TestAppleRemindersClient(ServiceTest):
         def mock_fetch_reminders(predicate, completion_handler):
             completion_handler([mock_reminder1, mock_reminder2])
         
-        self.mock_store.fetchRemindersMatchingPredicate_completion_.side_effect = mock_fetch_reminders
+        mock_store.fetchRemindersMatchingPredicate_completion_.side_effect = mock_fetch_reminders
 
         # Mock Foundation calendar for date components conversion
         mock_calendar_obj = Mock()
         mock_foundation.NSCalendar.currentCalendar.return_value = mock_calendar_obj
         mock_calendar_obj.dateFromComponents_.return_value = MockNSDate(ARBITRARY_DUE)
 
-        client = self.create_client_with_mocks(config)
+        client = AppleRemindersClient(config)
         reminders = list(client.get_reminders())
 
         # Should only get reminder with due date
-        self.assertEqual(len(reminders), 1)
-        self.assertIsNotNone(reminders[0]['due_date'])
+        assert len(reminders) == 1
+        assert reminders[0]['due_date'] is not None
 
-    def test_get_reminders_no_matching_lists(self):
+    def test_get_reminders_no_matching_lists(self, base_config, mock_store):
         """Test getting reminders when no lists match configuration."""
-        config = AppleRemindersConfig(
-            service='applereminders',
-            lists=['NonExistent']
-        )
+        config = base_config.copy(update={
+            'lists': ['NonExistent'],
+        })
 
-        mock_calendar = Mock()
-        mock_calendar.title.return_value = 'Work'
-        self.mock_store.calendarsForEntityType_.return_value = [mock_calendar]
+        mock_store.calendarsForEntityType_.return_value = [MOCK_CALENDARS['Work']]
 
-        client = self.create_client_with_mocks(config)
-        reminders = list(client.get_reminders())
+        client = AppleRemindersClient(config)
+        reminders = client.get_reminders()
 
         # Should get no reminders since 'Work' is not in the configured lists
-        self.assertEqual(len(reminders), 0)
+        assert reminders == []
 
-    def test_reminder_to_dict_success(self):
+    def test_reminder_to_dict_success(self, base_config):
         """Test successful conversion of reminder to dictionary."""
-        config = AppleRemindersConfig(service='applereminders')
-
-        client = self.create_client_with_mocks(config)
+        client = AppleRemindersClient(base_config)
 
         # Mock the date components conversion
         client._components_to_datetime = Mock(return_value=ARBITRARY_DUE.isoformat())
@@ -707,26 +661,24 @@ class TestAppleRemindersClient(ServiceTest):
         result = client._reminder_to_dict(mock_reminder, 'Shopping')
 
         # Check non-date fields
-        self.assertEqual(result['id'], 'test-reminder-123')
-        self.assertEqual(result['title'], 'Buy groceries')
-        self.assertEqual(result['notes'], 'Milk, bread, eggs')
-        self.assertEqual(result['due_date'], ARBITRARY_DUE.isoformat())
-        self.assertEqual(result['completed'], False)
-        self.assertEqual(result['completion_date'], None)
-        self.assertEqual(result['priority'], 5)
-        self.assertEqual(result['list_name'], 'Shopping')
-        self.assertEqual(result['url'], 'x-apple-reminderkit://REMCDReminder/test-reminder-123')
-        self.assertEqual(result['flagged'], False)
+        assert result['id'] == 'test-reminder-123'
+        assert result['title'] == 'Buy groceries'
+        assert result['notes'] == 'Milk, bread, eggs'
+        assert result['due_date'] == ARBITRARY_DUE.isoformat()
+        assert result['completed'] is False
+        assert result['completion_date'] is None
+        assert result['priority'] == 5
+        assert result['list_name'] == 'Shopping'
+        assert result['url'] == 'x-apple-reminderkit://REMCDReminder/test-reminder-123'
+        assert result['flagged'] is False
 
         # Check date fields are ISO strings (since our _format_nsdate converts them)
-        self.assertEqual(result['creation_date'], ARBITRARY_CREATED.isoformat())
-        self.assertEqual(result['modification_date'], ARBITRARY_MODIFIED.isoformat())
+        assert result['creation_date'] == ARBITRARY_CREATED.isoformat()
+        assert result['modification_date'] == ARBITRARY_MODIFIED.isoformat()
 
-    def test_reminder_to_dict_error_handling(self):
+    def test_reminder_to_dict_error_handling(self, base_config):
         """Test error handling in reminder to dictionary conversion."""
-        config = AppleRemindersConfig(service='applereminders')
-
-        client = self.create_client_with_mocks(config)
+        client = AppleRemindersClient(base_config)
 
         # Create a mock reminder that raises an exception when accessing title
         mock_reminder = Mock()
@@ -737,24 +689,17 @@ class TestAppleRemindersClient(ServiceTest):
         result = client._reminder_to_dict(mock_reminder, 'TestList')
 
         # Should return a fallback dictionary
-        self.assertEqual(result['id'], 'test-id')  # This works since calendarItemIdentifier doesn't fail
-        self.assertEqual(result['title'], 'Error')  # Falls back to 'Error' when title fails
-        self.assertEqual(result['list_name'], 'TestList')
+        assert result['id'] == 'test-id'  # This works since calendarItemIdentifier doesn't fail
+        assert result['title'] == 'Error'  # Falls back to 'Error' when title fails
+        assert result['list_name'] == 'TestList'
 
 
-class TestAppleRemindersService(AbstractServiceTest, ServiceTest):
+class TestAppleRemindersService(AbstractServiceTest):
     """Test cases for AppleRemindersService class."""
 
-    maxDiff = None
-    SERVICE_CONFIG = {
-        'service': 'applereminders',
-    }
-
-    def test_to_taskwarrior(self):
-        """Test the to_taskwarrior method through the service."""
-        service = self.get_mock_service(AppleRemindersService)
-        issue = service.get_issue_for_record(ARBITRARY_REMINDER, ARBITRARY_EXTRA)
-
+    @pytest.mark.parametrize('sink', ['raw', 'constructor'])
+    def test_to_taskwarrior(self, issue, sink):
+        """Test to_taskwarrior, both raw and as completed by TaskConstructor."""
         # Mock the date formatting to return actual strings
         with patch.object(issue, '_get_formatted_date') as mock_format_date:
             mock_format_date.side_effect = lambda date_value: (
@@ -763,110 +708,93 @@ class TestAppleRemindersService(AbstractServiceTest, ServiceTest):
                 else None
             )
 
-            result = TaskConstructor(issue).get_taskwarrior_record()
-
-        expected_subset = {
-            'annotations': [],
-            'description': ('(bw)Is# - Buy groceries'),
-            'due': ARBITRARY_DUE.strftime('%Y%m%dT%H%M%SZ'),
-            'entry': ARBITRARY_CREATED.strftime('%Y%m%dT%H%M%SZ'),
-            'priority': 'M',
-            'project': 'Shopping',
-            'status': 'pending',
-            'tags': [],
-
-            # Apple Reminders specific UDAs
-            'appleremindersid': 'test-reminder-123',
-            'applereminderstitle': 'Buy groceries',
-            'applereminderssubnotes': 'Milk, bread, eggs',
-            'appleremindersduedate': ARBITRARY_DUE.strftime('%Y%m%dT%H%M%SZ'),
-            'applereminderscreationdate': ARBITRARY_CREATED.strftime('%Y%m%dT%H%M%SZ'),
-            'appleremindersmodificationdate': ARBITRARY_MODIFIED.strftime('%Y%m%dT%H%M%SZ'),
-            'applereminderslist': 'Shopping',
-            'appleremindersurl': 'x-apple-reminderkit://REMCDReminder/test-reminder-123',
-            'appleremindersflagged': 'true',
-        }
+            if sink == 'constructor':
+                result = TaskConstructor(issue).get_taskwarrior_record()
+                expected_subset = EXPECTED_ARBITRARY_TASK
+            else:
+                result = issue.to_taskwarrior()
+                expected_subset = EXPECTED_ARBITRARY_RECORD
 
         # Check that all expected fields are present and correct
-        for key, expected_value in expected_subset.items():
-            self.assertIn(key, result, f"Missing key: {key}")
-            self.assertEqual(result[key], expected_value, f"Wrong value for key {key}")
-
-    @patch('bugwarrior.services.applereminders.AppleRemindersClient')
-    def test_issues(self, mock_client_class):
-        """Test the issues() generator method."""
-        # Mock the client and its methods
-        mock_client = Mock()
-        mock_client.get_reminders.return_value = [
-            ARBITRARY_REMINDER,
-            HIGH_PRIORITY_REMINDER,
-        ]
-        mock_client_class.return_value = mock_client
+        if not expected_subset.items() <= result.items():
+            mismatched = {
+                key: result.get(key)
+                for key, value in expected_subset.items() if result.get(key) != value
+            }
+            pytest.fail(f"Wrong or missing values: {mismatched}")
 
-        service = self.get_mock_service(AppleRemindersService)
-        issues = list(service.issues())
+        # Not completed, so no completion date field
+        assert issue.COMPLETION_DATE not in result
 
-        self.assertEqual(len(issues), 2)
+    def test_issues(self, issues):
+        """Test the issues() generator method."""
+        assert len(issues) == 2
 
         # Check first issue
         first_issue = issues[0]
-        self.assertEqual(first_issue.record['id'], 'test-reminder-123')
-        self.assertEqual(first_issue.record['title'], 'Buy groceries')
-        self.assertEqual(first_issue.record['list_name'], 'Shopping')
+        assert first_issue.record['id'] == 'test-reminder-123'
+        assert first_issue.record['title'] == 'Buy groceries'
+        assert first_issue.record['list_name'] == 'Shopping'
 
         # Check second issue
         second_issue = issues[1]
-        self.assertEqual(second_issue.record['id'], 'test-reminder-789')
-        self.assertEqual(second_issue.record['title'], 'Urgent task')
-        self.assertEqual(second_issue.record['list_name'], 'Work')
+        assert second_issue.record['id'] == 'test-reminder-789'
+        assert second_issue.record['title'] == 'Urgent task'
+        assert second_issue.record['list_name'] == 'Work'
 
-    @patch('bugwarrior.services.applereminders.AppleRemindersClient')
-    def test_issues_with_notes_annotation(self, mock_client_class):
+    def test_issues_with_notes_annotation(self, issues):
         """Test issues generation with notes as annotations."""
-        mock_client = Mock()
-        mock_client.get_reminders.return_value = [ARBITRARY_REMINDER]
-        mock_client_class.return_value = mock_client
+        # Only ARBITRARY_REMINDER has notes.
+        task = issues[0].to_taskwarrior()
+        # Notes should be added as annotation through the Issue's to_taskwarrior method
+        assert 'Milk, bread, eggs' in task['annotations']
 
-        service = self.get_mock_service(AppleRemindersService, config_overrides={
-            'add_notes_as_annotation': True
-        })
-        issues = list(service.issues())
+    def test_end_to_end_workflow(self, tasks):
+        """Test complete workflow from service to task construction."""
+        # Should get both reminders
+        assert len(tasks) == 2
 
-        self.assertEqual(len(issues), 1)
-        issue = issues[0]
-        # Notes should be added as annotation through the Issue's to_taskwarrior method
-        task = issue.to_taskwarrior()
-        self.assertIn('Milk, bread, eggs', task['annotations'])
+        # Tags are based on the list_name from the reminder data
+        id_to_list = {r['id']: r['list_name'] for r in ISSUES_REMINDERS}
+
+        # Check that all tasks have the expected structure
+        for task in tasks:
+            assert 'appleremindersid' in task
+            assert 'applereminderstitle' in task
+            assert 'priority' in task
+            assert 'tags' in task
+
+            # Should have list name as tag due to import_labels_as_tags
+            task_list_name = id_to_list.get(task['appleremindersid'])
+            if task_list_name:
+                assert task_list_name in task['tags']
 
     @patch('bugwarrior.services.applereminders.AppleRemindersClient')
-    def test_issues_client_error(self, mock_client_class):
+    def test_issues_client_error(self, mock_client_class, make_service):
         """Test error handling when client fails to get reminders."""
-        mock_client = Mock()
+        mock_client = _mock_client_with(())
         mock_client.get_reminders.side_effect = Exception("Connection failed")
         mock_client_class.return_value = mock_client
 
-        service = self.get_mock_service(AppleRemindersService)
+        service = make_service()
 
-        with self.assertRaises(Exception) as cm:
+        with pytest.raises(Exception, match="Connection failed"):
             list(service.issues())
 
-        self.assertIn("Connection failed", str(cm.exception))
-
-    def test_keyring_service(self):
+    def test_keyring_service(self, service):
         """Test keyring service name generation."""
-        service = self.get_mock_service(AppleRemindersService)
         keyring_service = service.get_keyring_service(service.config)
-        self.assertEqual(keyring_service, "bugwarrior://applereminders")
+        assert keyring_service == "bugwarrior://applereminders"
+
+        # The vault command looks it up on the class, like other services.
+        assert AppleRemindersService.get_keyring_service(service.config) == keyring_service
 
     @patch('bugwarrior.services.applereminders.AppleRemindersClient')
-    def test_service_initialization_with_config(self, mock_client_class):
+    def test_service_initialization_with_config(self, mock_client_class, make_service):
         """Test service initialization with various configurations."""
-        mock_client = Mock()
-        # Mock get_reminders to return a list so len() works
-        mock_client.get_reminders.return_value = [ARBITRARY_REMINDER, HIGH_PRIORITY_REMINDER]
-        mock_client_class.return_value = mock_client
+        mock_client_class.return_value = _mock_client_with(ISSUES_REMINDERS)
 
-        service = self.get_mock_service(AppleRemindersService, config_overrides={
+        service = make_service(config_overrides={
             'lists': ['Work', 'Personal'],
             'include_completed': True,
             'exclude_lists': ['Archive'],
@@ -879,34 +807,34 @@ class TestAppleRemindersService(AbstractServiceTest, ServiceTest):
         # Verify client is initialized with correct config
         mock_client_class.assert_called_once()
         call_args = mock_client_class.call_args[0][0]  # First positional argument (config)
-        self.assertEqual(call_args.lists, ['Work', 'Personal'])
-        self.assertEqual(call_args.include_completed, True)
-        self.assertEqual(call_args.exclude_lists, ['Archive'])
-        self.assertEqual(call_args.due_only, True)
-        self.assertIsNotNone(service.client)
+        assert call_args.lists == ['Work', 'Personal']
+        assert call_args.include_completed is True
+        assert call_args.exclude_lists == ['Archive']
+        assert call_args.due_only is True
+        assert service.client is not None
 
 
-class TestAppleRemindersConfig(ServiceTest):
+class TestAppleRemindersConfig:
     """Test cases for AppleRemindersConfig schema validation."""
 
-    SERVICE_CONFIG = {
-        'service': 'applereminders',
-    }
-
     def test_minimal_config(self):
         """Test minimal valid configuration."""
         config = {
             'service': 'applereminders',
         }
 
+        expected = {
+            'service': 'applereminders',
+            'lists': [],
+            'include_completed': False,
+            'import_labels_as_tags': False,
+            'exclude_lists': [],
+            'due_only': False,
+        }
+
         # Should not raise validation error
         service_config = AppleRemindersConfig(**config)
-        self.assertEqual(service_config.service, 'applereminders')
-        self.assertEqual(list(service_config.lists), [])
-        self.assertEqual(service_config.include_completed, False)
-        self.assertEqual(service_config.import_labels_as_tags, False)
-        self.assertEqual(list(service_config.exclude_lists), [])
-        self.assertEqual(service_config.due_only, False)
+        assert service_config.dict(include=expected.keys()) == expected
 
     def test_full_config(self):
         """Test configuration with all options."""
@@ -921,12 +849,7 @@ class TestAppleRemindersConfig(ServiceTest):
         }
 
         service_config = AppleRemindersConfig(**config)
-        self.assertEqual(service_config.lists, ['Work', 'Personal'])
-        self.assertEqual(service_config.include_completed, True)
-        self.assertEqual(service_config.import_labels_as_tags, True)
-        self.assertEqual(service_config.label_template, '{{label}}-tag')
-        self.assertEqual(service_config.exclude_lists, ['Archive', 'Old'])
-        self.assertEqual(service_config.due_only, True)
+        assert service_config.dict(include=config.keys()) == config
 
     def test_invalid_service_name(self):
         """Test configuration with invalid service name."""
@@ -934,85 +857,20 @@ class TestAppleRemindersConfig(ServiceTest):
             'service': 'invalid_service',
         }
 
-        with self.assertRaises(Exception):
+        with pytest.raises(Exception):
             AppleRemindersConfig(**config)
 
 
-class TestAppleRemindersIntegration(ServiceTest):
+class TestAppleRemindersIntegration:
     """Integration tests combining multiple components."""
 
-    SERVICE_CONFIG = {
-        'service': 'applereminders',
-        'lists': ['Work'],
-        'import_labels_as_tags': True,
-    }
-
-    @patch('bugwarrior.services.applereminders.AppleRemindersClient')
-    def test_end_to_end_workflow(self, mock_client_class):
-        """Test complete workflow from service to task construction."""
-        # Set up mock client
-        mock_client = Mock()
-        mock_client.get_reminders.return_value = [
-            HIGH_PRIORITY_REMINDER,
-            ARBITRARY_REMINDER,
-        ]
-        mock_client_class.return_value = mock_client
-
-        service = self.get_mock_service(AppleRemindersService)
-        issues = list(service.issues())
-
-        # Should get both reminders
-        self.assertEqual(len(issues), 2)
-
-        # Convert to taskwarrior format
-        tasks = []
-        for issue in issues:
-            task = TaskConstructor(issue).get_taskwarrior_record()
-            tasks.append(task)
-
-        # Verify task properties
-        self.assertEqual(len(tasks), 2)
-
-        # Check that all tasks have the expected structure
-        for task in tasks:
-            self.assertIn('appleremindersid', task)
-            self.assertIn('applereminderstitle', task)
-            self.assertIn('priority', task)
-            self.assertIn('tags', task)
-
-            # Should have list name as tag due to import_labels_as_tags
-            # Tags are based on the list_name from the reminder data
-            task_list_name = None
-            for reminder in [HIGH_PRIORITY_REMINDER, ARBITRARY_REMINDER]:
-                if task['appleremindersid'] == reminder['id']:
-                    task_list_name = reminder['list_name']
-                    break
-            if task_list_name:
-                self.assertIn(task_list_name, task['tags'])
-
-    @patch('bugwarrior.services.applereminders.AppleRemindersClient')
-    def test_priority_mapping_integration(self, mock_client_class):
+    def test_priority_mapping_integration(self, service, priority_tasks):
         """Test priority mapping in complete workflow."""
-        mock_client = Mock()
-        mock_client.get_reminders.return_value = [
-            HIGH_PRIORITY_REMINDER,    # priority 9 -> H
-            ARBITRARY_REMINDER,        # priority 5 -> M
-            LOW_PRIORITY_REMINDER,     # priority 1 -> L
-            NO_PRIORITY_REMINDER,      # priority 0 -> default
-        ]
-        mock_client_class.return_value = mock_client
-
-        service = self.get_mock_service(AppleRemindersService)
-        issues = list(service.issues())
-
-        priorities = []
-        for issue in issues:
-            task = TaskConstructor(issue).get_taskwarrior_record()
-            priorities.append(task['priority'])
+        priorities = [task['priority'] for task in priority_tasks]
 
         # Should have all different priority levels
-        self.assertIn('H', priorities)  # High
-        self.assertIn('M', priorities)  # Medium
-        self.assertIn('L', priorities)  # Low
+        assert 'H' in priorities  # High
+        assert 'M' in priorities  # Medium
+        assert 'L' in priorities  # Low
         # Default for no priority
-        self.assertIn(service.config.default_priority, priorities)
+        assert service.config.default_priority in priorities
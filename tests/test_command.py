@@ -7,6 +7,8 @@ from click.testing import CliRunner
 
 from bugwarrior import command
 from bugwarrior.config.load import BugwarriorConfigParser
+from bugwarrior.services.bz import BugzillaService
+from bugwarrior.services.github import GithubService
 
 from .base import ConfigTest
 from .test_github import ARBITRARY_ISSUE, ARBITRARY_EXTRA
@@ -33,25 +35,36 @@ def fake_bz_issues(self):
         })]
 
 
-class TestPull(ConfigTest):
-
-    def setUp(self):
-        super().setUp()
+def fake_failing_issues(self):
+    raise Exception('message')
 
-        self.runner = CliRunner()
-        self.config = BugwarriorConfigParser()
 
-        self.config['general'] = {
+class TestPull(ConfigTest):
+    # Only the taskrc path differs between tests; setUp fills it in.
+    CONFIG = {
+        'general': {
             'targets': 'my_service',
             'static_fields': 'project, priority',
-            'taskrc': self.taskrc,
-        }
-        self.config['my_service'] = {
+        },
+        'my_service': {
             'service': 'github',
             'github.login': 'ralphbean',
             'github.token': 'abc123',
             'github.username': 'ralphbean',
-        }
+        },
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.runner = CliRunner()
+
+    def setUp(self):
+        super().setUp()
+
+        self.config = BugwarriorConfigParser()
+        self.config.read_dict(self.CONFIG)
+        self.config['general']['taskrc'] = self.taskrc
 
         self.write_rc(self.config)
 
@@ -60,20 +73,18 @@ class TestPull(ConfigTest):
         Write configparser object to temporary bugwarriorrc path.
         """
         rcfile = os.path.join(self.tempdir, '.config/bugwarrior/bugwarriorrc')
-        if not os.path.exists(os.path.dirname(rcfile)):
-            os.makedirs(os.path.dirname(rcfile))
+        os.makedirs(os.path.dirname(rcfile), exist_ok=True)
         with open(rcfile, 'w') as configfile:
             conf.write(configfile)
         return rcfile
 
-    @mock.patch(
-        'bugwarrior.services.github.GithubService.issues', fake_github_issues)
+    @mock.patch.object(GithubService, 'issues', fake_github_issues)
     def test_success(self):
         """
         A normal `bugwarrior pull` invocation.
         """
         with self.caplog.at_level(logging.INFO):
-            self.runner.invoke(command.cli, args=('pull', '--debug'))
+            self.runner.invoke(command.cli, args=('pull', '--debug'), catch_exceptions=False)
 
         logs = [rec.message for rec in self.caplog.records]
 
@@ -81,10 +92,7 @@ class TestPull(ConfigTest):
         self.assertIn('Updating 0 tasks', logs)
         self.assertIn('Closing 0 tasks', logs)
 
-    @mock.patch(
-        'bugwarrior.services.github.GithubService.issues',
-        lambda self: (_ for _ in ()).throw(Exception('message'))
-    )
+    @mock.patch.object(GithubService, 'issues', fake_failing_issues)
     def test_failure(self):
         """
         A broken `bugwarrior pull` invocation.
@@ -97,14 +105,8 @@ class TestPull(ConfigTest):
         self.assertEqual(self.caplog.records[0].message,
                          "Aborted [my_service] due to critical error.")
 
-    @mock.patch(
-        'bugwarrior.services.github.GithubService.issues',
-        lambda self: []
-    )
-    @mock.patch(
-        'bugwarrior.services.bz.BugzillaService.issues',
-        lambda self: (_ for _ in ()).throw(Exception('message'))
-    )
+    @mock.patch.object(GithubService, 'issues', lambda self: [])
+    @mock.patch.object(BugzillaService, 'issues', fake_failing_issues)
     def test_partial_failure_survival(self):
         """
         One service is broken but the other succeeds.
@@ -129,8 +131,7 @@ class TestPull(ConfigTest):
             'Aborted [my_broken_service] due to critical error.', logs)
         self.assertIn('Adding 0 tasks', logs)
 
-    @mock.patch(
-        'bugwarrior.services.github.GithubService.issues', fake_github_issues)
+    @mock.patch.object(GithubService, 'issues', fake_github_issues)
     @mock.patch('bugzilla.Bugzilla')
     def test_partial_failure_database_integrity(self, bugzillalib):
         """
@@ -149,18 +150,14 @@ class TestPull(ConfigTest):
 
         # Add a task to each service.
         with self.caplog.at_level(logging.DEBUG):
-            with mock.patch('bugwarrior.services.bz.BugzillaService.issues',
-                            fake_bz_issues):
+            with mock.patch.object(BugzillaService, 'issues', fake_bz_issues):
                 self.runner.invoke(command.cli, args=('pull'))
         logs = [rec.message for rec in self.caplog.records]
         self.assertIn('Adding 2 tasks', logs)
 
         # Break the service and run pull again.
         with self.caplog.at_level(logging.INFO):
-            with mock.patch(
-                'bugwarrior.services.bz.BugzillaService.issues',
-                lambda self: (_ for _ in ()).throw(Exception('message'))
-            ):
+            with mock.patch.object(BugzillaService, 'issues', fake_failing_issues):
                 self.runner.invoke(command.cli, args=('pull'))
         logs = [rec.message for rec in self.caplog.records]
 
@@ -172,8 +169,7 @@ class TestPull(ConfigTest):
         self.assertNotIn('Closing 1 tasks', logs)
         self.assertNotIn('Completing task', logs)
 
-    @mock.patch(
-        'bugwarrior.services.github.GithubService.issues', fake_github_issues)
+    @mock.patch.object(GithubService, 'issues', fake_github_issues)
     def test_legacy_cli(self):
         """
         Test that invoking the subcommand function directly still works.
@@ -181,7 +177,7 @@ class TestPull(ConfigTest):
         Also test that it logs a deprecation warning.
         """
         with self.caplog.at_level(logging.INFO):
-            self.runner.invoke(command.pull, args=('--debug'))
+            self.runner.invoke(command.pull, args=('--debug'), catch_exceptions=False)
 
         logs = [rec.message for rec in self.caplog.records]
 
@@ -191,9 +187,10 @@ class TestPull(ConfigTest):
 
 
 class TestIni2Toml(TestCase):
-    def setUp(self):
-        super().setUp()
-        self.runner = CliRunner()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.runner = CliRunner()
 
     def test_bugwarriorrc(self):
         basedir = pathlib.Path(__file__).parent